@@ -85,6 +85,9 @@ STAT_TABLE_UNCOMMON_COUNT = 'uncommon count'
 STAT_TABLE_TOTAL = 'total'
 STAT_TABLE_PAR = 'PAR'
 
+## ContributionTable
+CONTRIBUTION_TABLE_DELTAS = (1, 10, 100)
+
 ## Plots
 DYNAMIC_PLOT = 'plotly'
 STATIC_PLOT = 'matplotlib'
@@ -31,11 +31,18 @@ analyze this data later on with, e.g., Metrics-Wallet.
 """
 
 
+import json
+import pickle
+
 from typing import Any, Iterable, Optional, Tuple
 
-from jsonpickle import decode as load_json
+try:
+    # orjson parses JSON several times faster than the standard library, when installed.
+    import orjson
+except ImportError:
+    orjson = None
 
-from metrics.core.model import Campaign
+from metrics.core.model import Campaign, Experiment, ExperimentWare, Input, InputSet
 
 from metrics.scalpel.listener import CampaignParserListener
 
@@ -44,6 +51,13 @@ from metrics.scalpel.parser import create_parser
 from metrics.scalpel.utils import configure_logger
 
 
+# The models a campaign is made of, indexed by the tag given to them by jsonpickle.
+_CAMPAIGN_MODELS = {
+    f'{model.__module__}.{model.__qualname__}': model
+    for model in (Campaign, Experiment, ExperimentWare, Input, InputSet)
+}
+
+
 def read_campaign(input_file: str,
                   log_level: str = 'WARNING') -> Tuple[Campaign, Optional[ScalpelConfiguration]]:
     """
@@ -62,6 +76,9 @@ def read_campaign(input_file: str,
     if input_file.lower().endswith('.json'):
         return read_json(input_file), None
 
+    if input_file.lower().endswith('.pkl') or input_file.lower().endswith('.pickle'):
+        return read_pickle(input_file), None
+
     raise ValueError(f'Unrecognized campaign format for file "{input_file}"')
 
 
@@ -94,8 +111,88 @@ def read_json(json_file: str) -> Campaign:
 
     :return: The read campaign.
     """
-    with open(json_file, 'r', encoding='utf-8') as json_campaign:
-        return load_json(json_campaign.read())
+    with open(json_file, 'rb') as json_campaign:
+        data = _parse_json(json_campaign.read())
+
+    try:
+        return _restore_models(data)
+
+    except ValueError:
+        # The campaign contains objects that only jsonpickle knows how to restore.
+        # It is imported lazily, as most campaigns never need it.
+        from jsonpickle.unpickler import Unpickler
+        return Unpickler().restore(data)
+
+
+def _parse_json(content: bytes) -> Any:
+    """
+    Parses a JSON document, with orjson when it is installed.
+
+    :param content: The JSON document to parse.
+
+    :return: The parsed document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+
+        except orjson.JSONDecodeError:
+            # jsonpickle writes NaN and infinite values as bare literals (e.g., NaN), which
+            # orjson rejects but the standard library accepts.
+            pass
+
+    return json.loads(content)
+
+
+def _restore_models(data: Any) -> Any:
+    """
+    Restores the models of a campaign from their representation produced by
+    jsonpickle, without going through jsonpickle's generic reflection.
+
+    :param data: The parsed JSON representation of (part of) a campaign.
+
+    :return: The restored object.
+
+    :raises ValueError: If the data contains objects that are not models
+                        of a campaign.
+    """
+    if isinstance(data, list):
+        return [_restore_models(value) for value in data]
+
+    if not isinstance(data, dict):
+        return data
+
+    model = None
+    attributes = {}
+    for key, value in data.items():
+        if key == 'py/object':
+            model = _CAMPAIGN_MODELS.get(value)
+            if model is None:
+                raise ValueError(f'Unsupported object type "{value}"')
+        elif key.startswith('py/'):
+            raise ValueError(f'Unsupported jsonpickle tag "{key}"')
+        else:
+            attributes[key] = _restore_models(value)
+
+    if model is None:
+        return attributes
+
+    restored = model.__new__(model)
+    restored.__dict__.update(attributes)
+    return restored
+
+
+def read_pickle(pickle_file: str) -> Campaign:
+    """
+    Reads a campaign that has been serialized in a pickle file, as produced
+    by Campaign.export(binary=True).
+
+    :param pickle_file: The path of the pickle file to read the campaign from.
+
+    :return: The read campaign.
+    """
+    with open(pickle_file, 'rb') as pickle_campaign:
+        return pickle.load(pickle_campaign)
 
 
 def read_object(yaml_configuration: str, campaign: Iterable[Any],
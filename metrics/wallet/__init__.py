@@ -20,20 +20,28 @@
 #  along with this program.                                                    #
 #  If not, see <https://www.gnu.org/licenses/>.                                #
 # ##############################################################################
-import pickle
+__all__ = [
+    'Analysis',
+    'BasicAnalysis',
+    'DecisionAnalysis',
+    'BoundOptiAnalysis',
+    'OptiAnalysis',
+    'OverviewOptiAnalysis',
+    'find_best_cpu_time_input',
+    'vectorizable',
+    'export_data_frame',
+    'clear_cache',
+    'import_analysis_from_file',
+    'FontWeight',
+    'LineType',
+    'MarkerShape',
+    'Position',
+]
 
 from metrics.wallet.analysis import Analysis, BasicAnalysis, DecisionAnalysis, BoundOptiAnalysis, OptiAnalysis, \
-    OverviewOptiAnalysis, find_best_cpu_time_input, export_data_frame
-from autograph.core.enumstyle import *
-
-import pandas as pd
-import jsonpickle.ext.pandas as jsonpickle_pd
-
-jsonpickle_pd.register_handlers()
+    OverviewOptiAnalysis, find_best_cpu_time_input, export_data_frame, vectorizable, clear_cache
+from autograph.core.enumstyle import FontWeight, LineType, MarkerShape, Position
 
 
 def import_analysis_from_file(filename) -> DecisionAnalysis:
-    with open(filename, 'rb') as file:
-        if filename.split('.')[-1] == 'csv':
-            return DecisionAnalysis(data_frame=pd.read_csv(file))
-        return DecisionAnalysis(data_frame=pickle.load(file))
+    return DecisionAnalysis.import_from_file(filename)
@@ -28,14 +28,18 @@ campaign.
 from __future__ import annotations
 
 import math
+import os
 import pickle
+import stat
+import tempfile
 import warnings
 from typing import List
 
 from metrics.wallet.plot import LinePlot, CDFPlot, ScatterPlot, BoxPlot, BarPlot
 
 from pandas import DataFrame
-from itertools import product, combinations
+from itertools import combinations
+import numpy as np
 import pandas as pd
 from deprecated import deprecated
 from types import SimpleNamespace
@@ -46,6 +50,22 @@ from metrics.scalpel import read_campaign
 
 warnings.formatwarning = lambda msg, *args, **kwargs: str(msg) + '\n'
 
+# Protocol 5 (PEP 574) pickles the buffers of the underlying arrays without extra copies.
+PICKLE_PROTOCOL = 5
+
+# Size of the write buffer of exported tables.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Below this number of groups, starting joblib workers costs more than it saves.
+_MIN_PARALLEL_GROUPS = 64
+
+# Maximum number of campaigns and dataframes kept in memory (see _cached_read).
+_READ_CACHE_SIZE = 8
+
+# For each description of cached data, the paths it was read from, the signature of the files under
+# these paths when it was read, and the data.
+_read_cache = {}
+
 
 def export_data_frame(data_frame, output=None, commas_for_number=False, dollars_for_number=False,
                       col_dict=None, **kwargs):
@@ -66,16 +86,22 @@ def export_data_frame(data_frame, output=None, commas_for_number=False, dollars_
             df = df[col_dict.keys()].rename(columns=col_dict)
 
         if commas_for_number:
-            df = df.applymap(lambda x: f"{x:,}")
+            df = df.copy()
+            for col in df.select_dtypes(include='number').columns:
+                df[col] = df[col].map('{:,}'.format)
 
         if dollars_for_number:
-            df = df.applymap(lambda x: f"${x}$")
+            df = df.apply(lambda col: '$' + col.map(str) + '$')
 
         ext = output.split('.')[-1]
 
+        # Missing values are written as empty cells by the writers, without filling a copy of
+        # the dataframe.
+        kwargs.setdefault('na_rep', '')
+
         if ext == 'tex':
-            with open(output, 'w') as file:
-                df.fillna('').to_latex(
+            with open(output, 'w', buffering=OUTPUT_BUFFER_SIZE) as file:
+                df.to_latex(
                     buf=file,
                     escape=False,
                     index_names=False,
@@ -83,23 +109,203 @@ def export_data_frame(data_frame, output=None, commas_for_number=False, dollars_
                     **kwargs
                 )
         elif ext == 'csv':
-            with open(output, 'w') as file:
-                df.fillna('').to_csv(
-                    buf=file,
-                    **kwargs
-                )
+            with open(output, 'w', buffering=OUTPUT_BUFFER_SIZE, newline='') as file:
+                df.to_csv(file, **kwargs)
         elif ext == 'xls' or ext == 'xlsx':
-            with open(output, 'w') as file:
-                df.fillna('').to_excel(
-                    buf=file,
-                    **kwargs
-                )
+            df.to_excel(output, **kwargs)
         else:
             raise ValueError('Only .tex|csv|xls(x) extensions are accepted.')
 
     return data_frame
 
 
+def _file_mode(filename):
+    """
+    Gives the permissions of a file written with open().
+    @param filename: the path of the file.
+    @return: the permissions of the file if it exists, else those of a new file.
+    """
+    try:
+        return stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def clear_cache():
+    """
+    Forgets the campaigns and dataframes kept in memory, which are otherwise read again only when
+    one of the files they were read from is modified.
+    """
+    _read_cache.clear()
+
+
+def _files_signature(paths):
+    """
+    Gives the modification times of the files under the given paths.
+    @param paths: paths of files or directories.
+    @return: the sorted pairs of each file path and its modification time.
+    """
+    signature = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    file = os.path.join(root, name)
+                    signature.append((file, os.stat(file).st_mtime_ns))
+        elif os.path.exists(path):
+            signature.append((path, os.stat(path).st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+def _cached_read(key, read):
+    """
+    Reads data once as long as none of the files it was read from is modified. At most
+    _READ_CACHE_SIZE data are kept, the least recently used one being forgotten first.
+    @param key: the hashable description of the data.
+    @param read: the function reading the data, returning it with the paths of the files or
+    directories it was read from.
+    @return: the read data, which must not be modified.
+    """
+    entry = _read_cache.pop(key, None)
+    if entry is None or _files_signature(entry[0]) != entry[1]:
+        data, paths = read()
+        entry = (paths, _files_signature(paths), data)
+    while len(_read_cache) >= _READ_CACHE_SIZE:
+        del _read_cache[next(iter(_read_cache))]
+    _read_cache[key] = entry
+    return entry[2]
+
+
+def _campaign_paths(input_file, config):
+    """
+    @param input_file: the file describing a campaign.
+    @param config: the configuration read from input_file, if any.
+    @return: the absolute paths of the files from which the campaign is read.
+    """
+    paths = [input_file] if config is None else [input_file, *config.get_path()]
+    return [os.path.abspath(path) for path in paths]
+
+
+def _cached_read_campaign(input_file, log_level):
+    """
+    Reads a campaign once as long as its input file and its log files are not modified.
+    @param input_file: the yaml file given to scalpel to parse logs
+    @param log_level: The minimum level for the events to log while parsing the campaign.
+    @return: the campaign and its configuration.
+    """
+    def read():
+        campaign, config = read_campaign(input_file, log_level)
+        return (campaign, config), _campaign_paths(input_file, config)
+
+    # The paths of the log files given in input_file are relative to the working directory.
+    return _cached_read(('campaign', os.path.abspath(input_file), os.getcwd(), log_level), read)
+
+
+def _cached_read_data_frame(filename):
+    """
+    Reads a previously exported dataframe once as long as its file is not modified.
+    @param filename: the filename of a previously exported Analysis.
+    @return: the read dataframe, which must not be modified.
+    """
+    path = os.path.abspath(filename)
+
+    def read():
+        ext = filename.split('.')[-1]
+        if ext == 'feather':
+            return pd.read_feather(path), [path]
+        if ext == 'parquet':
+            return pd.read_parquet(path), [path]
+        with open(path, 'rb') as file:
+            if ext == 'csv':
+                return pd.read_csv(file), [path]
+            return pickle.load(file), [path]
+
+    return _cached_read(('data_frame', path), read)
+
+
+def _apply_on_groups(df, by, func, n_jobs=1):
+    """
+    Applies a function on each group of a dataframe, possibly in parallel: each joblib job then
+    applies it on a contiguous chunk of whole groups, so that the result is the same as with a
+    single job.
+    @param df: the dataframe to group.
+    @param by: the columns to group by.
+    @param func: the function to apply on each group.
+    @param n_jobs: the number of jobs (-1 for all the processors).
+    @return: the concatenated results of the function.
+    """
+    # Grouping by the values of the columns rather than by their names keeps these columns in the
+    # groups given to the function (pandas 3 excludes the grouping columns from the groups).
+    groups = df.groupby([df[c].values for c in _make_list(by)], observed=True)
+
+    if n_jobs != 1 and groups.ngroups >= _MIN_PARALLEL_GROUPS:
+        try:
+            from joblib import Parallel, delayed, effective_n_jobs
+        except ImportError:
+            pass
+        else:
+            codes = groups.ngroup().to_numpy()
+            bounds = np.linspace(0, groups.ngroups, effective_n_jobs(n_jobs) + 1).astype(int)
+            return pd.concat(Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(_apply_on_groups)(df[(codes >= low) & (codes < high)], by, func)
+                for low, high in zip(bounds[:-1], bounds[1:]) if low < high
+            ))
+
+    return groups.apply(func)
+
+
+def _concat_experiments(frames):
+    """
+    Concatenates dataframes of experiments, the input and experiment-ware columns staying
+    categorical when they are in the first dataframe.
+    @param frames: the dataframes to concatenate.
+    @return: the concatenated dataframe.
+    """
+    df = pd.concat(frames, ignore_index=True)
+    for col in (EXPERIMENT_INPUT, EXPERIMENT_XP_WARE):
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _remove_unused_categories(df):
+    """
+    Forgets the inputs and experiment-wares of the categorical columns that no experiment refers to
+    anymore. The dataframe is not modified, so that it may be a slice of another one.
+    @param df: the dataframe of experiments.
+    @return: the dataframe itself when it has no categorical column, or a new one.
+    """
+    categories = {
+        col: df[col].cat.remove_unused_categories()
+        for col in (EXPERIMENT_INPUT, EXPERIMENT_XP_WARE)
+        if isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**categories) if categories else df
+
+
+def vectorizable(reduction, column):
+    """
+    Declares that an input consistency predicate only depends on a reduction of one column of the
+    experiments of the input. 'check_input_consistency' then computes it for all the inputs at
+    once instead of calling the predicate on each input.
+    @param reduction: 'nunique' if the input is consistent when the column has at most one distinct
+    (non missing) value, or 'all' if the input is consistent when all the values of the column are
+    true.
+    @param column: the column on which the reduction is applied.
+    @return: the decorator marking the predicate.
+    """
+    if reduction not in ('nunique', 'all'):
+        raise ValueError(f'Unknown reduction: {reduction}')
+
+    def decorator(is_consistent):
+        is_consistent._input_reduction = (reduction, column)
+        return is_consistent
+
+    return decorator
+
+
 def find_best_cpu_time_input(df):
     """
     Find the best cpu time experiment in a dataframe
@@ -115,6 +321,9 @@ class BasicAnalysis:
     experiment-wares and inputs
     """
 
+    _defer_global_success = False
+    _global_success_outdated = False
+
     def __init__(self, input_file: str = None, data_frame: DataFrame = None,
                  log_level: str = 'WARNING'):
         """
@@ -128,7 +337,7 @@ class BasicAnalysis:
             self.check()
             return
 
-        campaign, config = read_campaign(input_file, log_level)
+        campaign, config = _cached_read_campaign(input_file, log_level)
 
         self._data_frame = DataFrameBuilder(campaign).build_from_campaign()
         self._data_frame[TIMEOUT_COL] = campaign.timeout
@@ -165,7 +374,7 @@ class BasicAnalysis:
 
         @return: the input of the dataframe.
         """
-        return list(self._data_frame[EXPERIMENT_INPUT].unique())
+        return self._data_frame[EXPERIMENT_INPUT].unique().tolist()
 
     @property
     def experiment_wares(self) -> List[str]:
@@ -173,7 +382,7 @@ class BasicAnalysis:
 
         @return: the experimentwares of the dataframe.
         """
-        return list(self._data_frame[EXPERIMENT_XP_WARE].unique())
+        return self._data_frame[EXPERIMENT_XP_WARE].unique().tolist()
 
     def copy(self):
         """
@@ -193,28 +402,48 @@ class BasicAnalysis:
         @param experiment_wares: gives the entire list of experiment-wares (complete the missing
         ones)
         """
-        self.check_success(is_success)
-        self.check_missing_experiments(inputs, experiment_wares)
+        # Success and missing experiments are merged in a single update of the global success,
+        # which must be up to date before calling the consistency lambdas.
+        self._defer_global_success = True
+        try:
+            self.check_success(is_success)
+            self.check_missing_experiments(inputs, experiment_wares)
+        finally:
+            self._defer_global_success = False
+        if self._global_success_outdated:
+            self._update_global_success()
         self.check_xp_consistency(is_consistent_by_xp)
         self.check_input_consistency(is_consistent_by_input)
 
-    def _check_global_success(self):
-        self._data_frame[SUCCESS_COL] = self._data_frame.apply(
-            lambda x: x[USER_SUCCESS_COL] and not (x[MISSING_DATA_COL]) and x[XP_CONSISTENCY_COL]
-                      and x[INPUT_CONSISTENCY_COL],
-            axis=1
-        )
-
-        self._data_frame[EXPERIMENT_CPU_TIME] = self._data_frame.apply(
-            lambda x: x[EXPERIMENT_CPU_TIME] if x[USER_SUCCESS_COL] else x[TIMEOUT_COL],
-            axis=1
-        )
+    def _update_global_success(self):
+        """
+        Updates the global success of experiments, or only records that it is outdated while
+        'check' is running.
+        """
+        if self._defer_global_success:
+            self._global_success_outdated = True
+            return
+        self._global_success_outdated = False
+        self._check_global_success()
 
-        self._data_frame[ERROR_COL] = self._data_frame.apply(
-            lambda x: x[MISSING_DATA_COL] or not (x[XP_CONSISTENCY_COL])
-                      or not (x[INPUT_CONSISTENCY_COL]),
-            axis=1
-        )
+    def _check_global_success(self):
+        df = self._data_frame
+        user_success = _as_bool(df[USER_SUCCESS_COL])
+        missing = _as_bool(df[MISSING_DATA_COL])
+        consistent_xp = _as_bool(df[XP_CONSISTENCY_COL])
+        consistent_input = _as_bool(df[INPUT_CONSISTENCY_COL])
+
+        # pd.eval fuses each expression in a single multi-threaded pass when numexpr is installed.
+        columns = {
+            'user_success': user_success.to_numpy(),
+            'missing': missing.to_numpy(),
+            'consistent_xp': consistent_xp.to_numpy(),
+            'consistent_input': consistent_input.to_numpy(),
+        }
+        df[SUCCESS_COL] = pd.eval(
+            'user_success & ~missing & consistent_xp & consistent_input', local_dict=columns)
+        df[EXPERIMENT_CPU_TIME] = df[EXPERIMENT_CPU_TIME].where(user_success, df[TIMEOUT_COL])
+        df[ERROR_COL] = pd.eval('missing | ~consistent_xp | ~consistent_input', local_dict=columns)
 
     def check_success(self, is_success):
         """
@@ -224,7 +453,7 @@ class BasicAnalysis:
         if is_success is None:
             return
         self._data_frame[USER_SUCCESS_COL] = self._data_frame.apply(is_success, axis=1)
-        self._check_global_success()
+        self._update_global_success()
 
     def check_missing_experiments(self, inputs: List[str] = None, experiment_wares: List[str] = None):
         """
@@ -235,21 +464,41 @@ class BasicAnalysis:
         inputs = self.inputs if inputs is None else inputs
         experiment_wares = self.experiment_wares if experiment_wares is None else experiment_wares
 
-        theoretical_df = DataFrame(
-            product(inputs, experiment_wares),
-            columns=[EXPERIMENT_INPUT, EXPERIMENT_XP_WARE]
-        )
+        theoretical = pd.MultiIndex.from_product(
+            [inputs, experiment_wares],
+            names=[EXPERIMENT_INPUT, EXPERIMENT_XP_WARE]
+        ).unique()
 
         self._data_frame[MISSING_DATA_COL] = False
-        self._data_frame = self._data_frame.join(
-            theoretical_df.set_index([EXPERIMENT_INPUT, EXPERIMENT_XP_WARE]), how='right',
-            on=[EXPERIMENT_INPUT, EXPERIMENT_XP_WARE])
-        self._data_frame[MISSING_DATA_COL] = self._data_frame[MISSING_DATA_COL].fillna(True)
+        df = self._data_frame
+
+        # Position of each experiment in the theoretical cartesian product (-1 if it is not part
+        # of it): the missing pairs are the positions that no experiment reaches.
+        positions = theoretical.get_indexer(
+            pd.MultiIndex.from_arrays([df[EXPERIMENT_INPUT], df[EXPERIMENT_XP_WARE]]))
+        known = positions >= 0
+        found = np.zeros(len(theoretical), dtype=bool)
+        found[positions[known]] = True
+        missing = np.flatnonzero(~found)
+
+        df = df[known]
+        positions = positions[known]
+        if len(missing) > 0:
+            filler = theoretical[missing].to_frame(index=False)
+            filler[MISSING_DATA_COL] = True
+            df = _concat_experiments([df, filler])
+            positions = np.concatenate([positions, missing])
+
+        # Experiments are ordered as the cartesian product of inputs and experiment-wares.
+        df = df.iloc[np.argsort(positions, kind='stable')]
+        if len(missing) > 0:
+            df = df.reset_index(drop=True)
+        self._data_frame = df
 
         n_missing = self._data_frame[MISSING_DATA_COL].sum()
 
         if n_missing > 0:
-            self._check_global_success()
+            self._update_global_success()
             warnings.warn(
                 f'{n_missing} experiments are missing and have been added as unsuccessful.')
 
@@ -268,7 +517,7 @@ class BasicAnalysis:
         n_inconsistencies = inconsistency.sum()
 
         if n_inconsistencies > 0:
-            self._check_global_success()
+            self._update_global_success()
             warnings.warn(
                 f'{n_inconsistencies} experiments are inconsistent '
                 f'and are declared as unsuccessful.'
@@ -277,12 +526,19 @@ class BasicAnalysis:
     def check_input_consistency(self, is_consistent):
         """
         Check input consistency
-        @param is_consistent_by_input: lambda certifying that an input is consistent
+        @param is_consistent_by_input: lambda certifying that an input is consistent (decorate it
+        with 'vectorizable' when possible, to check all the inputs at once)
         """
         if is_consistent is None:
             return
 
-        s = self._data_frame.groupby(EXPERIMENT_INPUT).apply(is_consistent)
+        if hasattr(is_consistent, '_input_reduction'):
+            reduction, column = is_consistent._input_reduction
+            s = self._data_frame.groupby(EXPERIMENT_INPUT, sort=False, observed=True)[column] \
+                .agg(reduction)
+            s = s <= 1 if reduction == 'nunique' else s.astype(bool)
+        else:
+            s = self._data_frame.groupby(EXPERIMENT_INPUT, sort=False, observed=True).apply(is_consistent)
 
         inconsistent_inputs = set(s[~s].index)
 
@@ -290,7 +546,7 @@ class BasicAnalysis:
             inconsistent_inputs)
 
         if len(inconsistent_inputs) > 0:
-            self._check_global_success()
+            self._update_global_success()
             warnings.warn(
                 f'{len(inconsistent_inputs)} inputs are inconsistent and linked experiments '
                 f'are now declared as unsuccessful.'
@@ -300,14 +556,15 @@ class BasicAnalysis:
         """
         Add a variable (column) to the dataframe
         @param new_var: the variable name
-        @param function: the function for creating this new column data
+        @param function: the function for creating this new column data, or directly the values of
+        this new column (much faster than a function applied on each experiment).
         @param inplace: False to make a copy of data, True else
         @return: the analysis with a new computed variable
         """
         if not inplace:
             return self.copy().add_variable(new_var, function, inplace=True)
         df = self._data_frame
-        df[new_var] = df.apply(function, axis=1)
+        df[new_var] = df.apply(function, axis=1) if callable(function) else function
         return self
 
     def remove_variables(self, vars: List[str], inplace=False):
@@ -322,6 +579,41 @@ class BasicAnalysis:
         self._data_frame.drop(columns=vars, inplace=True)
         return self
 
+    def categorize(self, inplace=False):
+        """
+        Stores the input and experiment-ware columns as categorical data: each name is kept once
+        and the experiments only store an integer code, which makes the dataframe lighter and
+        speeds up filters and groupings on these columns.
+        @param inplace: False to make a copy of data, True else
+        @return: the analysis with categorical input and experiment-ware columns
+        """
+        if not inplace:
+            return self.copy().categorize(inplace=True)
+        for col in (EXPERIMENT_INPUT, EXPERIMENT_XP_WARE):
+            self._data_frame[col] = self._data_frame[col].astype('category')
+        return self
+
+    def downcast(self, inplace=False):
+        """
+        Stores each numeric column with the smallest type holding its values (e.g. float32 for the
+        times), which halves the memory read by the tables and plots. Float values then only keep
+        about 7 significant digits, and arithmetic on small integer columns may overflow. The
+        timeout is kept as is, since the PARx scores multiply it.
+        @param inplace: False to make a copy of data, True else
+        @return: the analysis with downcast numeric columns
+        """
+        if not inplace:
+            return self.copy().downcast(inplace=True)
+        columns = self._data_frame.select_dtypes(include=['integer', 'floating']).columns
+        for col in columns.drop(TIMEOUT_COL, errors='ignore'):
+            values = self._data_frame[col]
+            if pd.api.types.is_integer_dtype(values):
+                self._data_frame[col] = pd.to_numeric(values, downcast='integer')
+            elif values.abs().max() <= np.finfo(np.float32).max:
+                # Unlike to_numeric, missing values (e.g. unsolved times) do not prevent the cast.
+                self._data_frame[col] = values.astype(np.float32)
+        return self
+
     def add_analysis(self, analysis):
         """
         Add an external analysis to the current one. The external analysis needs to be verified by
@@ -338,7 +630,7 @@ class BasicAnalysis:
         @param data_frame: the external data_frame to add.
         @return: the merged analysis
         """
-        return self.__class__(data_frame=pd.concat([self._data_frame, data_frame], ignore_index=True))
+        return self.__class__(data_frame=_concat_experiments([self._data_frame, data_frame]))
 
     def add_virtual_experiment_ware(self, function=find_best_cpu_time_input,
                                     xp_ware_set=None, name='vbew') -> BasicAnalysis:
@@ -353,27 +645,62 @@ class BasicAnalysis:
         @param name: name of the vbew.
         @return: a new instance of Analysis with the new vbew.
         """
+        return self.add_data_frame(
+            data_frame=self._make_virtual_experiment_ware(function, xp_ware_set, name))
+
+    def add_virtual_experiment_wares(self, specs) -> BasicAnalysis:
+        """
+        Make several Virtual ExperimentWares at once: the dataframe is extended and checked only
+        once, instead of once for each call to 'add_virtual_experiment_ware'. Each vbew is computed
+        from the experiment-wares of the current analysis only (not from the other new vbews).
+        @param specs: an iterable of (function, xp_ware_set, name) tuples, each one having the
+        meaning of the parameters of 'add_virtual_experiment_ware'.
+        @return: a new instance of Analysis with the new vbews.
+        """
+        return self.__class__(data_frame=_concat_experiments(
+            [self._data_frame] + [
+                self._make_virtual_experiment_ware(function, xp_ware_set, name)
+                for function, xp_ware_set, name in specs
+            ]
+        ))
+
+    def _make_virtual_experiment_ware(self, function, xp_ware_set, name) -> DataFrame:
+        """
+        Computes the experiments of a Virtual ExperimentWare.
+        @param function: the function to create the virtual ExperimentWare
+        @param xp_ware_set: a sub set of experiment-wares for which we take the wanted values
+        @param name: name of the vbew.
+        @return: the dataframe of the vbew experiments.
+        """
         df = self._data_frame
         if xp_ware_set is None:
             xp_ware_set = self.experiment_wares
 
         df_vbs = df[df[EXPERIMENT_XP_WARE].isin(xp_ware_set)]
 
-        df_vbs = df_vbs.groupby(EXPERIMENT_INPUT).apply(function).dropna(how='all') \
-            .assign(experiment_ware=lambda x: name)
+        if function is find_best_cpu_time_input:
+            # A single sort of all the experiments gives the best one of each input, which are
+            # then ordered by input as the groups are.
+            df_vbs = df_vbs.sort_values(
+                by=[SUCCESS_COL, EXPERIMENT_CPU_TIME], ascending=[False, True], kind='stable'
+            ).drop_duplicates(subset=[EXPERIMENT_INPUT]).sort_values(EXPERIMENT_INPUT, kind='stable')
+        else:
+            df_vbs = df_vbs.groupby(EXPERIMENT_INPUT, observed=True).apply(function).dropna(how='all')
 
-        return self.add_data_frame(data_frame=df_vbs)
+        return df_vbs.assign(experiment_ware=lambda x: name)
 
     def filter_analysis(self, function, inplace=False) -> BasicAnalysis:
         """
         Filters the dataframe based on the given function.
-        @param column: the filtering function.
+        @param function: the filtering function, or directly a boolean mask of the experiments to
+        keep (much faster than a function applied on each experiment).
         @return: the filtered dataframe in a new instance of Analysis.
         """
         if not inplace:
             return self.copy().filter_analysis(function, inplace=True)
 
-        self._data_frame = self._data_frame[self._data_frame.apply(function, axis=1)]
+        mask = self._data_frame.apply(function, axis=1) if callable(function) else function
+        self._data_frame = _remove_unused_categories(self._data_frame[mask])
 
         return self
 
@@ -383,11 +710,8 @@ class BasicAnalysis:
         @param experiment_wares: the sub set of experiment_wares to remove.
         @return: the filtered analysis in a new instance of Analysis.
         """
-        if not inplace:
-            return self.copy().remove_experiment_wares(experiment_wares, inplace=True)
-
         return self.filter_analysis(
-            lambda x: x[EXPERIMENT_XP_WARE] not in experiment_wares,
+            ~self._data_frame[EXPERIMENT_XP_WARE].isin(experiment_wares),
             inplace
         )
 
@@ -397,7 +721,10 @@ class BasicAnalysis:
         @param experiment_wares: the sub set of experiment_wares to keep.
         @return: the filtered analysis in a new instance of Analysis.
         """
-        return self.filter_analysis(lambda x: x[EXPERIMENT_XP_WARE] in experiment_wares, inplace)
+        return self.filter_analysis(
+            self._data_frame[EXPERIMENT_XP_WARE].isin(experiment_wares),
+            inplace
+        )
 
     def filter_inputs(self, function, how='all', inplace=False) -> BasicAnalysis:
         """
@@ -409,34 +736,40 @@ class BasicAnalysis:
         - 'any' needs that the function returns the True value for at least one experiment of the
         input
 
-        @param function: the filtering function.
+        @param function: the filtering function, or directly a boolean mask of the experiments
+        (much faster than a function applied on each experiment).
         @param how: the how method.
         @return: the filtered analysis in a new instance of Analysis.
         """
-        if not inplace:
-            return self.copy().filter_inputs(function, how, inplace=True)
-
-        if how == 'all':
-            s = self._data_frame.groupby(EXPERIMENT_INPUT).apply(
-                lambda df: df.apply(function, axis=1).all())
-        elif how == 'any':
-            s = self._data_frame.groupby(EXPERIMENT_INPUT).apply(
-                lambda df: df.apply(function, axis=1).any())
-        else:
+        if how not in ('all', 'any'):
             raise AttributeError(
                 '"how" parameter could only takes these next values: "all" or "any".')
 
-        self._data_frame = self._data_frame[self._data_frame[EXPERIMENT_INPUT].isin(s[s].index)]
+        if callable(function):
+            function = self._data_frame.apply(function, axis=1).astype(bool)
+        elif not isinstance(function, pd.Series):
+            function = pd.Series(function, index=self._data_frame.index)
 
-        return self
+        return self._filter_inputs_by_mask(function, how, inplace)
+
+    def _filter_inputs_by_mask(self, mask, how, inplace):
+        """
+        Filters the dataframe based on a boolean mask of the experiments and the method 'how'.
+        @param mask: the boolean mask of the experiments.
+        @param how: the how method ('all' or 'any').
+        @return: the filtered analysis.
+        """
+        kept = mask.groupby(self._data_frame[EXPERIMENT_INPUT], sort=False, observed=True).transform(how)
+        # Experiments without input belong to no group: their mask is NaN, and they are dropped.
+        return self.filter_analysis(kept.eq(True), inplace)
 
     def delete_common_failed_inputs(self, inplace=False):
         """
         Based on success column, it removes all the inputs that no solver has solved.
         @rtype: the filtered analysis
         """
-        return self.filter_inputs(
-            function=lambda x: x[SUCCESS_COL],
+        return self._filter_inputs_by_mask(
+            _as_bool(self._data_frame[SUCCESS_COL]),
             how='any',
             inplace=inplace
         )
@@ -446,8 +779,8 @@ class BasicAnalysis:
         Based on success column, it removes all the inputs that all solver has solved.
         @rtype: the filtered analysis
         """
-        return self.filter_inputs(
-            function=lambda x: not x[SUCCESS_COL],
+        return self._filter_inputs_by_mask(
+            ~_as_bool(self._data_frame[SUCCESS_COL]),
             how='any',
             inplace=inplace
         )
@@ -457,8 +790,8 @@ class BasicAnalysis:
         Based on success column, it keeps all the inputs that all solver has failed.
         @rtype: the filtered analysis
         """
-        return self.filter_inputs(
-            function=lambda x: not x[SUCCESS_COL],
+        return self._filter_inputs_by_mask(
+            ~_as_bool(self._data_frame[SUCCESS_COL]),
             how='all',
             inplace=inplace
         )
@@ -468,8 +801,8 @@ class BasicAnalysis:
         Based on success column, it keeps all the inputs that no solver has failed.
         @rtype: the filtered analysis
         """
-        return self.filter_inputs(
-            function=lambda x: x[SUCCESS_COL],
+        return self._filter_inputs_by_mask(
+            _as_bool(self._data_frame[SUCCESS_COL]),
             how='all',
             inplace=inplace
         )
@@ -479,8 +812,8 @@ class BasicAnalysis:
         Based on success column and cpu time, it removes all the inputs commonly solved within a certain time limit
         @rtype: the filtered analysis
         """
-        return self.filter_inputs(
-            function=lambda x: not x[SUCCESS_COL] or x[EXPERIMENT_CPU_TIME] > limit,
+        return self._filter_inputs_by_mask(
+            ~_as_bool(self._data_frame[SUCCESS_COL]) | (self._data_frame[EXPERIMENT_CPU_TIME] > limit),
             how='any',
             inplace=inplace
         )
@@ -492,33 +825,45 @@ class BasicAnalysis:
         @return: a list of Analysis with each group.
         """
         return [
-            self.__class__(data_frame=group.copy()) for _, group in self._data_frame.groupby(column)
+            self.__class__(data_frame=group.copy())
+            for _, group in self._data_frame.groupby(column, observed=True)
         ]
 
-    def apply_on_groupby(self, by, func, inplace=False):
+    def apply_on_groupby(self, by, func, inplace=False, n_jobs=1):
         """
         Makes a groupby of the analysis and apply a function on each group.
+        @param n_jobs: the number of joblib jobs sharing the groups, when joblib is installed (-1
+        for all the processors).
         @rtype: The merged returns of each function calls in a new analysis.
         """
         if not inplace:
-            return self.copy().apply_on_groupby(by, func, inplace=True)
+            return self.copy().apply_on_groupby(by, func, inplace=True, n_jobs=n_jobs)
 
-        self._data_frame = self._data_frame.groupby(
-            by
-        ).apply(func).reset_index(drop=True)
+        self._data_frame = _apply_on_groups(self._data_frame, by, func, n_jobs) \
+            .reset_index(drop=True)
 
         return self
 
+    def _xp_ware_masks(self):
+        """
+
+        @return: for each experiment-ware, the boolean mask of its experiments in the dataframe.
+        """
+        xpw = self._data_frame[EXPERIMENT_XP_WARE].to_numpy()
+        return {x: xpw == x for x in self.experiment_wares}
+
     def all_experiment_ware_pair_analysis(self) -> List[BasicAnalysis]:
         """
 
         @return: all the analysis pairs (of each pair of experiment-wares)
         """
         xpw = self.experiment_wares
+        masks = self._xp_ware_masks()
 
         return [
-            self.keep_experiment_wares([xpw[i], j]) for i in range(len(xpw) - 1) for j in
-            xpw[i + 1:]
+            self.__class__(data_frame=_remove_unused_categories(
+                self._data_frame[masks[xpw[i]] | masks[j]].copy()))
+            for i in range(len(xpw) - 1) for j in xpw[i + 1:]
         ]
 
     def all_xp_ware_combination_analysis(self) -> List[BasicAnalysis]:
@@ -526,11 +871,15 @@ class BasicAnalysis:
 
         @return: all the analysis combinations (of each combination of experiment-wares)
         """
+        xpw = self.experiment_wares
+        masks = self._xp_ware_masks()
 
         return [
-            self.keep_experiment_wares(xpws)
-            for i in range(2, len(self.experiment_wares) + 1)
-            for xpws in combinations(self.experiment_wares, i)
+            self.__class__(data_frame=_remove_unused_categories(self._data_frame[
+                np.logical_or.reduce([masks[x] for x in xpws])
+            ].copy()))
+            for i in range(2, len(xpw) + 1)
+            for xpws in combinations(xpw, i)
         ]
 
     def all_xp_ware_pair_analysis(self) -> List[BasicAnalysis]:
@@ -605,7 +954,7 @@ class BasicAnalysis:
         if normalize_function is None:
             normalize_function = default_normalize_function
         tab = []
-        for index, group in self.data_frame.groupby('input'):
+        for index, group in self.data_frame.groupby(EXPERIMENT_INPUT, observed=True):
             row = {'input': index}
             values = []
             for ew in self.experiment_wares:
@@ -646,18 +995,38 @@ class BasicAnalysis:
 
     def export(self, filename=None):
         """
-        Export the current Analysis
+        Export the current Analysis. The format depends on the extension of the filename: 'csv',
+        'feather' and 'parquet' (both requiring pyarrow), or a pickle for any other extension.
         @param filename: the exported Analysis filename.
         @return: True if the analysis is well exported, else False.
         """
         if filename is None:
-            return pickle.dumps(self._data_frame, protocol=pickle.DEFAULT_PROTOCOL)
-
-        if filename.split('.')[-1] == 'csv':
-            return self._data_frame.to_csv(filename, index=False)
-        else:
-            with open(filename, 'wb') as file:
-                return pickle.dump(self._data_frame, file, protocol=pickle.DEFAULT_PROTOCOL)
+            return pickle.dumps(self._data_frame, protocol=PICKLE_PROTOCOL)
+
+        # Writing to a temporary file of the target directory first ensures that a failed export
+        # never leaves a truncated analysis behind, and that concurrent exports do not collide.
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(filename)),
+                                         suffix='.tmp', delete=False) as tmp_file:
+            tmp_filename = tmp_file.name
+        try:
+            ext = filename.split('.')[-1]
+            if ext == 'csv':
+                self._data_frame.to_csv(tmp_filename, index=False)
+            elif ext == 'feather':
+                self._data_frame.reset_index(drop=True).to_feather(tmp_filename,
+                                                                   compression='zstd')
+            elif ext == 'parquet':
+                self._data_frame.to_parquet(tmp_filename, engine='pyarrow', index=False)
+            else:
+                with open(tmp_filename, 'wb') as file:
+                    pickle.dump(self._data_frame, file, protocol=PICKLE_PROTOCOL)
+            # The temporary file is only readable by its owner: the exported file gets the mode
+            # of the file it replaces, or the one given by the umask to a new file.
+            os.chmod(tmp_filename, _file_mode(filename))
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            os.remove(tmp_filename)
+            raise
 
     @classmethod
     def import_from_file(cls, filename, eval_data: bool = False):
@@ -667,14 +1036,11 @@ class BasicAnalysis:
         @param eval_data: If data in the read data_frame are to be evaluated using eval.
         @return: the imported Analysis.
         """
-        with open(filename, 'rb') as file:
-            if filename.split('.')[-1] == 'csv':
-                df = pd.read_csv(file)
-            else:
-                df = pickle.load(file)
-            if eval_data:
-                df = df.applymap(lambda x: eval(str(x)))
-            return cls(data_frame=df)
+        df = _cached_read_data_frame(filename).copy()
+        if eval_data:
+            for col in df.select_dtypes(exclude='number').columns:
+                df[col] = df[col].map(lambda x: eval(str(x)))
+        return cls(data_frame=df)
 
     def scatter_plot(self, xp_ware_x, xp_ware_y, color_col=None, scatter_col=EXPERIMENT_CPU_TIME,
                      **kwargs):
@@ -708,6 +1074,12 @@ def _is_none_or_nan(x):
     return x is None or math.isnan(x)
 
 
+def _as_bool(s):
+    # Same truth values as Python's bool(), so that missing values (NaN) are seen as True, as
+    # they were when the columns were combined row by row.
+    return s.astype(bool)
+
+
 def _make_list(l):
     if isinstance(l, list):
         return l
@@ -716,6 +1088,10 @@ def _make_list(l):
     return [l]
 
 
+def _is_minimization(objective):
+    return objective == 'min'
+
+
 def default_explode(df, samp, objective):
     d: dict = df.iloc[0].to_dict()
     times = _make_list(d.pop(EXPERIMENT_TIMESTAMP_LIST))
@@ -727,29 +1103,28 @@ def default_explode(df, samp, objective):
     if len(bounds) != len(times):
         raise Exception('Bound list length and time list length must be equals.')
 
-    l = []
-    i = 0
-    for j in range(len(bounds)):
-        while i < len(samp) and times[j] > samp[i]:
-            d2 = d.copy()
-            d2[EXPERIMENT_STATUS] = d2[EXPERIMENT_STATUS] if d2[EXPERIMENT_CPU_TIME] < samp[i] else 'INCOMPLETE'
-            if SUCCESS_COL not in d2:
-                d2[SUCCESS_COL] = True
-            d2[SUCCESS_COL] = d2[SUCCESS_COL] and d2[EXPERIMENT_STATUS] == 'COMPLETE'
-            d2[EXPERIMENT_CPU_TIME] = times[j - 1] if j - 1 >= 0 else samp[i]
-            d2[TIMEOUT_COL] = samp[i]
-            d2[EXPERIMENT_BEST_BOUND] = bounds[j - 1] if j - 1 >= 0 else None
-            l.append(d2)
-            i += 1
-
-    for j in range(i, len(samp)):
-        d2 = d.copy()
-        d2[EXPERIMENT_CPU_TIME] = times[-1] if len(times) > 0 else samp[j]
-        d2[TIMEOUT_COL] = samp[j]
-        d2[EXPERIMENT_BEST_BOUND] = bounds[-1] if len(times) > 0 else None
-        l.append(d2)
-
-    return pd.DataFrame(l)
+    # For each sampling time, the number of bounds found so far (times and samp are sorted).
+    n_found = np.searchsorted(times, samp, side='right') if times else np.zeros(len(samp), dtype=int)
+
+    # Sampling times before the last bound has been found are those at which the solver was
+    # still running: these experiments are then incomplete.
+    running = n_found < len(times)
+    complete = ~running | (np.asarray(samp) > d[EXPERIMENT_CPU_TIME])
+    status = [d[EXPERIMENT_STATUS] if c else 'INCOMPLETE' for c in complete]
+    success = d.get(SUCCESS_COL, True)
+
+    n = len(samp)
+    columns = {key: [value] * n for key, value in d.items()}
+    columns[EXPERIMENT_STATUS] = status
+    columns[SUCCESS_COL] = [
+        bool(success) and st == 'COMPLETE' if r else d.get(SUCCESS_COL, math.nan)
+        for r, st in zip(running, status)
+    ]
+    columns[EXPERIMENT_CPU_TIME] = [times[j - 1] if j > 0 else t for j, t in zip(n_found, samp)]
+    columns[TIMEOUT_COL] = list(samp)
+    columns[EXPERIMENT_BEST_BOUND] = [bounds[j - 1] if j > 0 else None for j in n_found]
+
+    return pd.DataFrame(columns)
 
 
 def _norm(min_b, max_b, x):
@@ -761,25 +1136,24 @@ def _norm(min_b, max_b, x):
 
 
 def _borda(x, df):
-    summ = 0
-
-    for _, row in df.iterrows():
-        if row['experiment_ware'] == x['experiment_ware'] or _is_none_or_nan(x['best_bound']):
-            continue
+    if _is_none_or_nan(x['best_bound']):
+        return 0
 
-        if _is_none_or_nan(row['best_bound']):
-            summ += 1
-            continue
+    others = df['experiment_ware'].to_numpy() != x['experiment_ware']
+    bounds = df['best_bound'].to_numpy(dtype=float)
+    no_bound = others & np.isnan(bounds)
+    better = others & ~no_bound & (x['best_bound'] > bounds)
+    tie = others & ~no_bound & (x['best_bound'] == bounds)
+    same_status = tie & (df['status'].to_numpy() == x['status'])
 
-        if x['best_bound'] != row['best_bound']:
-            summ += 1 if x['best_bound'] > row['best_bound'] else 0
-            continue
+    summ = int(no_bound.sum() + better.sum())
 
-        if x['status'] == row['status']:
-            summ += row['cpu_time'] / (x['cpu_time'] + row['cpu_time'])
-            continue
+    if x['status'] == 'COMPLETE':
+        summ += int((tie & ~same_status).sum())
 
-        summ += 1 if x['status'] == 'COMPLETE' else 0
+    if same_status.any():
+        cpu_times = df['cpu_time'].to_numpy(dtype=float)[same_status]
+        summ += (cpu_times / (x['cpu_time'] + cpu_times)).sum()
 
     return summ
 
@@ -834,6 +1208,58 @@ def borda_score(x, min_b, max_b, df):
     return _borda(x, df)
 
 
+def _optimality_scores(df, min_b, max_b):
+    return _as_bool(df['success']).astype(int).to_numpy()
+
+
+def _dominance_scores(df, min_b, max_b):
+    return (df['best_bound'].to_numpy(dtype=float) == max_b).astype(int)
+
+
+def _norm_bound_scores(df, min_b, max_b):
+    bounds = df['best_bound'].to_numpy(dtype=float)
+    if max_b == min_b or _is_none_or_nan(max_b):
+        return (bounds == max_b).astype(int)
+    with np.errstate(invalid='ignore'):
+        return np.where(np.isnan(bounds), 0., (bounds - min_b) / (float(max_b) - min_b))
+
+
+def _borda_scores(df, min_b, max_b):
+    bounds = df['best_bound'].to_numpy(dtype=float)
+    status = df['status'].to_numpy()
+    cpu_times = df['cpu_time'].to_numpy(dtype=float)
+    xpw = df['experiment_ware'].to_numpy()
+
+    # Each row compares the experiment of the row with those of the columns.
+    others = (xpw[:, None] != xpw[None, :]) & ~np.isnan(bounds)[:, None]
+    no_bound = others & np.isnan(bounds)[None, :]
+    better = others & (bounds[:, None] > bounds[None, :])
+    tie = others & (bounds[:, None] == bounds[None, :])
+    same_status = tie & (status[:, None] == status[None, :])
+
+    scores = no_bound.sum(axis=1) + better.sum(axis=1) + np.where(
+        status == 'COMPLETE', (tie & ~same_status).sum(axis=1), 0)
+
+    if not same_status.any():
+        return scores
+
+    shares = np.divide(
+        np.broadcast_to(cpu_times[None, :], same_status.shape),
+        cpu_times[:, None] + cpu_times[None, :],
+        out=np.zeros(same_status.shape),
+        where=same_status
+    )
+    return scores + shares.sum(axis=1)
+
+
+# Whole-group counterparts of the scores above, used by _compute_scores instead of scoring
+# each experiment separately.
+optimality_score._vectorized = _optimality_scores
+dominance_score._vectorized = _dominance_scores
+norm_bound_score._vectorized = _norm_bound_scores
+borda_score._vectorized = _borda_scores
+
+
 DEFAULT_SCORE_METHODS = {
     'optimality': optimality_score,
     'dominance': dominance_score,
@@ -847,7 +1273,10 @@ def _compute_scores(df, default_solver, score_map):
     max_b = df.best_bound.max()
 
     for col, lbd in score_map.items():
-        df[col] = df.apply(lambda x: lbd(x, min_b, max_b, df), axis=1)
+        if hasattr(lbd, '_vectorized'):
+            df[col] = lbd._vectorized(df, min_b, max_b)
+        else:
+            df[col] = df.apply(lambda x: lbd(x, min_b, max_b, df), axis=1)
 
     if default_solver is not None:
         def_s = df[df.experiment_ware == default_solver].iloc[0]
@@ -858,16 +1287,6 @@ def _compute_scores(df, default_solver, score_map):
     return df
 
 
-def _input_agg(df, col):
-    d = df.iloc[0].to_dict()
-    d2 = {
-        'experiment_ware': d['experiment_ware'],
-        'timeout': d['timeout'],
-        col: df[col].mean()
-    }
-    return pd.Series(d2)
-
-
 class BoundOptiAnalysis(BasicAnalysis):
     """
     An Optimality Analysis is an analysis with the constraint of having the cartesian product of
@@ -880,7 +1299,7 @@ class BoundOptiAnalysis(BasicAnalysis):
     """
 
     def __init__(self, input_file: str = None, data_frame: DataFrame = None,
-                 basic_analysis: BasicAnalysis = None, func=default_explode, samp=None, objective=lambda s: s == 'min',
+                 basic_analysis: BasicAnalysis = None, func=default_explode, samp=None, objective=_is_minimization,
                  log_level: str = 'WARNING'):
         """
         Constructs an optimality analysis by giving an 'input_file' to parse the campaign logs OR a
@@ -895,47 +1314,54 @@ class BoundOptiAnalysis(BasicAnalysis):
         @param objective a lambda to find the objective direction
         @param log_level The minimum level for the events to log while parsing the campaign.
         """
-        if input_file is not None or basic_analysis is not None:
-            super().__init__(
-                input_file,
-                None if basic_analysis is None else basic_analysis.data_frame,
-                log_level
-            )
-            columns = set(self._data_frame.columns)
-            expected_columns = {EXPERIMENT_OBJECTIVE, EXPERIMENT_STATUS, EXPERIMENT_BOUND_LIST,
-                                EXPERIMENT_TIMESTAMP_LIST,
-                                EXPERIMENT_CPU_TIME}
-            missing = expected_columns - columns
-            if missing:
-                raise ValueError(f'Some columns are missing: {missing}')
-            self._explode_experiments(func, samp, objective)
+        if basic_analysis is None and input_file is not None:
+            if func is default_explode and objective is _is_minimization:
+                self._data_frame = _cached_explode(
+                    type(self), input_file, log_level, None if samp is None else tuple(samp)
+                ).copy()
+            else:
+                self._build(input_file, None, log_level, func, samp, objective)
+        elif basic_analysis is not None:
+            self._build(input_file, basic_analysis.data_frame, log_level, func, samp, objective)
         elif data_frame is not None:
             self._data_frame = data_frame
         else:
             raise AttributeError('input_file or data_frame or basic_analysis needs to be given.')
 
+    def _build(self, input_file, data_frame, log_level, func, samp, objective):
+        super().__init__(input_file, data_frame, log_level)
+        columns = set(self._data_frame.columns)
+        expected_columns = {EXPERIMENT_OBJECTIVE, EXPERIMENT_STATUS, EXPERIMENT_BOUND_LIST,
+                            EXPERIMENT_TIMESTAMP_LIST,
+                            EXPERIMENT_CPU_TIME}
+        missing = expected_columns - columns
+        if missing:
+            raise ValueError(f'Some columns are missing: {missing}')
+        self._explode_experiments(func, samp, objective)
+
     def _explode_experiments(self, func, samp, objective):
+        if samp is None:
+            samp = [self.data_frame[TIMEOUT_COL].max()]
+
         self.apply_on_groupby(
             by=[EXPERIMENT_INPUT, EXPERIMENT_XP_WARE],
-            func=lambda df: func(
-                df,
-                [self.data_frame.timeout.max()] if samp is None else samp,
-                objective
-            ),
+            func=lambda df: func(df, samp, objective),
             inplace=True
         )
 
-    def compute_scores(self, default_solver=None, score_map=DEFAULT_SCORE_METHODS):
+    def compute_scores(self, default_solver=None, score_map=DEFAULT_SCORE_METHODS, n_jobs=1):
         """
         Computes the list of scoring method on the analysis.
         @param default_solver: A default solver permits to apply an additional operation
         (with additional data variables) permitting to compare scores to a default solver score.
         @param score_map: a dictionnary of scoring methods with their names and the function to apply.
+        @param n_jobs: the number of joblib jobs computing the scores (-1 for all the processors).
         """
         self.apply_on_groupby(
             by=['input', 'timeout'],
             func=lambda df: _compute_scores(df, default_solver, score_map),
-            inplace=True
+            inplace=True,
+            n_jobs=n_jobs
         )
 
     def opti_line_plot(self, col, **kwargs):
@@ -945,12 +1371,13 @@ class BoundOptiAnalysis(BasicAnalysis):
         @param kwargs: kwargs are given to the line_plot figure
         @return: the drawn figure
         """
-        return self.apply_on_groupby(
-            by=['experiment_ware', 'timeout'],
-            func=lambda df: _input_agg(df, col)
-        ).line_plot(
-            index='timeout',
-            column='experiment_ware',
+        df = self._data_frame.groupby([EXPERIMENT_XP_WARE, TIMEOUT_COL], observed=True)[col] \
+            .mean() \
+            .reset_index()
+
+        return self.__class__(data_frame=df).line_plot(
+            index=TIMEOUT_COL,
+            column=EXPERIMENT_XP_WARE,
             values=col,
             **kwargs
         )
@@ -958,6 +1385,27 @@ class BoundOptiAnalysis(BasicAnalysis):
     # def score_number_times_best_bound(self):
 
 
+def _cached_explode(cls, input_file, log_level, samp):
+    """
+    Explodes the experiments of a campaign with the default exploding functions, once as long as
+    the files of the campaign are not modified.
+    @param cls: the class of optimality analysis to build.
+    @param input_file: the yaml file to extract data
+    @param log_level: The minimum level for the events to log while parsing the campaign.
+    @param samp: the sampling times to apply on the exploding function, as a tuple
+    @return: the exploded dataframe, which must not be modified.
+    """
+    def read():
+        analysis = cls.__new__(cls)
+        analysis._build(input_file, None, log_level, default_explode,
+                        None if samp is None else list(samp), _is_minimization)
+        _, config = _cached_read_campaign(input_file, log_level)
+        return analysis.data_frame, _campaign_paths(input_file, config)
+
+    return _cached_read(
+        ('explode', cls, os.path.abspath(input_file), os.getcwd(), log_level, samp), read)
+
+
 class OverviewOptiAnalysis(BasicAnalysis):
     def __init__(self, input_file: str = None, data_frame: DataFrame = None,
                  basic_analysis: BasicAnalysis = None, log_level: str = 'WARNING'):
@@ -992,7 +1440,7 @@ class OverviewOptiAnalysis(BasicAnalysis):
             agg_col = []
         agg_col = [EXPERIMENT_XP_WARE] + agg_col
         new_df = []
-        for index, group in self._data_frame.groupby(EXPERIMENT_INPUT):
+        for index, group in self._data_frame.groupby(EXPERIMENT_INPUT, sort=False, observed=True):
             best = min if 'min' in group[EXPERIMENT_OBJECTIVE].values else max
             best_bound = best([v for v in group[EXPERIMENT_BEST_BOUND]])
             for ew in group[EXPERIMENT_XP_WARE]:
@@ -1005,7 +1453,7 @@ class OverviewOptiAnalysis(BasicAnalysis):
                 tmp['Number of solutions'] = bound is not None
                 tmp['Number of optimal solutions'] = row[EXPERIMENT_CPU_TIME] < row[TIMEOUT_COL]
                 new_df.append(tmp)
-        return pd.DataFrame(new_df).groupby(agg_col).agg('sum')
+        return pd.DataFrame(new_df).groupby(agg_col, observed=True).agg('sum')
 
     def bound_bar_plot(self):
         df = self.bound_stat_table()
@@ -1034,43 +1482,65 @@ def get_as_list(l, index):
         return l
 
 
-def _cpu_time_stat(x, i):
-    return x[EXPERIMENT_CPU_TIME] if x[SUCCESS_COL] else x[TIMEOUT_COL] * i
+def _cpu_time_stat(df, i):
+    # Times are summed as float64, even when downcast columns store them with smaller types.
+    return df[EXPERIMENT_CPU_TIME].astype(np.float64) \
+        .where(_as_bool(df[SUCCESS_COL]), df[TIMEOUT_COL].astype(np.float64) * i)
 
 
 def _compute_cpu_time_stats(df, par):
-    return pd.Series({**{
-        STAT_TABLE_COUNT: df[SUCCESS_COL].sum(),
-        STAT_TABLE_SUM: df.apply(lambda x: _cpu_time_stat(x, 1), axis=1).sum(),
-    }, **{
-        STAT_TABLE_PAR + str(i): df.apply(lambda x: _cpu_time_stat(x, i), axis=1).sum() for i in par
-    }})
-
-
-def _contribution_agg(sli: pd.DataFrame):
-    sli = sli.sort_values(by=[SUCCESS_COL, EXPERIMENT_CPU_TIME], ascending=[False, True])
-    first = sli.iloc[0]
-    second = sli.iloc[1]
-    index = [EXPERIMENT_XP_WARE, EXPERIMENT_CPU_TIME, 'unique', 'second_time']
-
-    if first[SUCCESS_COL]:
-        return pd.Series([
-            first[EXPERIMENT_XP_WARE],
-            first[EXPERIMENT_CPU_TIME],
-            not second[SUCCESS_COL],
-            second[EXPERIMENT_CPU_TIME] if second[SUCCESS_COL] else 1000000
-        ],
-            index=index
-        )
+    # The statistics of all the experiment-wares are summed at once from per experiment columns,
+    # instead of building a series for each experiment-ware.
+    columns = {
+        STAT_TABLE_COUNT: df[SUCCESS_COL] == True,  # Missing values are not counted, as by sum().
+        STAT_TABLE_SUM: _cpu_time_stat(df, 1),
+        **{STAT_TABLE_PAR + str(i): _cpu_time_stat(df, i) for i in par}
+    }
+    return pd.DataFrame(columns).groupby(df[EXPERIMENT_XP_WARE], observed=True).sum()
+
 
-    return pd.Series([None, None, False, None], index=index)
+def _contribution_raw(df: pd.DataFrame):
+    success = _as_bool(df[SUCCESS_COL]).to_numpy()
+    cpu_times = df[EXPERIMENT_CPU_TIME].to_numpy()
+    inputs = pd.factorize(df[EXPERIMENT_INPUT])[0]
+
+    # A single stable sort puts the experiments of each input together, successful first and
+    # then by increasing cpu time: the two best experiments of each input start its block.
+    order = np.lexsort((cpu_times.astype(float), ~success, inputs))
+    inputs = inputs[order]
+    first = np.flatnonzero(np.r_[True, inputs[1:] != inputs[:-1]])
+    second = first + 1
+    has_second = second < len(order)
+    has_second[has_second] = inputs[second[has_second]] == inputs[first[has_second]]
+    second = np.where(has_second, second, first)
+
+    solved = success[order[first]]
+    second_solved = has_second & success[order[second]]
+    first, second, second_solved = order[first[solved]], order[second[solved]], second_solved[solved]
+
+    return pd.DataFrame({
+        EXPERIMENT_XP_WARE: df[EXPERIMENT_XP_WARE].to_numpy()[first],
+        EXPERIMENT_CPU_TIME: cpu_times[first],
+        'unique': ~second_solved,
+        'second_time': np.where(second_solved, cpu_times[second], 1000000)
+    })
 
 
 def _make_cactus_plot_df(analysis, cumulated, cactus_col):
     df_solved = analysis.data_frame[analysis.data_frame[SUCCESS_COL]]
-    df_cactus = df_solved.pivot(columns=EXPERIMENT_XP_WARE, values=cactus_col)
-    for col in df_cactus.columns:
-        df_cactus[col] = df_cactus[col].sort_values().values
+    codes, xp_wares = pd.factorize(df_solved[EXPERIMENT_XP_WARE], sort=True)
+    values = df_solved[cactus_col].to_numpy(dtype=float)
+
+    # Each value is put at its rank among the sorted values of its experiment-ware (the missing
+    # values being last), instead of pivoting one sparse row per experiment before sorting.
+    order = np.lexsort((values, codes))
+    codes, values = codes[order], values[order]
+    counts = np.bincount(codes, minlength=len(xp_wares))
+    ranks = np.arange(len(codes)) - np.repeat(np.cumsum(counts) - counts, counts)
+    matrix = np.full((counts.max(initial=0), len(xp_wares)), np.nan)
+    matrix[ranks, codes] = values
+
+    df_cactus = pd.DataFrame(matrix, columns=pd.Index(xp_wares, name=EXPERIMENT_XP_WARE))
     df_cactus = df_cactus.dropna(how='all').reset_index(drop=True)
     df_cactus.index += 1
     # df_cactus = df_cactus[df_cactus.index > self._x_min]
@@ -1081,24 +1551,18 @@ def _make_cactus_plot_df(analysis, cumulated, cactus_col):
     return df_cactus.cumsum() if cumulated else df_cactus
 
 
-def _compute_performance_ratio(df, row, vbew_name):
-    time_vbew = df[(df[EXPERIMENT_INPUT] == row[EXPERIMENT_INPUT]) & (df[EXPERIMENT_XP_WARE] == vbew_name)][
-        EXPERIMENT_CPU_TIME]
-    if len(time_vbew) > 0:
-        return row[EXPERIMENT_CPU_TIME] / \
-            time_vbew.iloc[0]
-    return None
+def _compute_performance_ratio(df, df_solved, vbew_name):
+    time_vbew = df_solved[df_solved[EXPERIMENT_XP_WARE] == vbew_name] \
+        .drop_duplicates(subset=[EXPERIMENT_INPUT]) \
+        .set_index(EXPERIMENT_INPUT)[EXPERIMENT_CPU_TIME]
+    return df[EXPERIMENT_CPU_TIME] / df[EXPERIMENT_INPUT].map(time_vbew)
 
 
 def _make_scatter_plot_df(analysis, xp_ware_x, xp_ware_y, scatter_col, color_col=None):
     df = analysis.keep_experiment_wares({xp_ware_x, xp_ware_y}).data_frame
+    # Only solved experiments are kept: the unsolved ones are drawn at the timeout by the pivot.
     df = df[df[SUCCESS_COL]]
 
-    df[EXPERIMENT_CPU_TIME] = df.apply(
-        lambda x: x['timeout'] if not x['success'] else x['cpu_time'],
-        axis=1
-    )
-
     df1 = df.pivot_table(
         index=EXPERIMENT_INPUT,
         columns=EXPERIMENT_XP_WARE,
@@ -1107,8 +1571,15 @@ def _make_scatter_plot_df(analysis, xp_ware_x, xp_ware_y, scatter_col, color_col
     )[[xp_ware_x, xp_ware_y]]
 
     if color_col is not None:
-        df2 = df.groupby(EXPERIMENT_INPUT).apply(lambda dff: set(dff[color_col]))
-        df1[color_col] = df2.apply(lambda x: list(x)[0] if len(x) == 1 else x)
+        # The color of an input is its single value, or the set of its values when they differ.
+        colors = df[[EXPERIMENT_INPUT, color_col]].drop_duplicates()
+        several = colors[EXPERIMENT_INPUT].duplicated(keep=False)
+        color = colors[~several].set_index(EXPERIMENT_INPUT)[color_col]
+        if several.any():
+            sets = colors[several].groupby(EXPERIMENT_INPUT, sort=False, observed=True)[color_col] \
+                .agg(set)
+            color = pd.concat([color.astype(object), sets])
+        df1[color_col] = color
 
     return df1
 
@@ -1165,26 +1636,25 @@ class DecisionAnalysis(BasicAnalysis):
         @param kwargs: kwargs are given to the 'export_data_frame(...)' function
         @return: a static table as a dataframe
         """
-        stats = self._data_frame.groupby(EXPERIMENT_XP_WARE).apply(
-            lambda df: _compute_cpu_time_stats(df, par))
+        stats = _compute_cpu_time_stats(self._data_frame, par)
         common = self.keep_common_solved_inputs().data_frame
         if len(common) > 0:
-            stats[STAT_TABLE_COMMON_COUNT] = common.groupby(EXPERIMENT_XP_WARE).apply(
-                lambda df: df[SUCCESS_COL].sum())
-            stats[STAT_TABLE_COMMON_SUM] = common.groupby(EXPERIMENT_XP_WARE).apply(
-                lambda df: df.apply(lambda x: _cpu_time_stat(x, 1), axis=1).sum())
+            common_stats = _compute_cpu_time_stats(common, [])
+            stats[STAT_TABLE_COMMON_COUNT] = common_stats[STAT_TABLE_COUNT]
+            stats[STAT_TABLE_COMMON_SUM] = common_stats[STAT_TABLE_SUM]
         else:
             stats[STAT_TABLE_COMMON_COUNT] = stats[STAT_TABLE_COMMON_SUM] = 0
         stats[STAT_TABLE_UNCOMMON_COUNT] = stats[STAT_TABLE_COUNT] - stats[STAT_TABLE_COMMON_COUNT]
         stats[STAT_TABLE_TOTAL] = len(self.inputs)
 
+        # The sums are truncated once sorted, and the count columns are already integers.
+        stats = stats.sort_values([STAT_TABLE_COUNT, STAT_TABLE_SUM], ascending=[False, True])
         return export_data_frame(
-            data_frame=stats.sort_values([STAT_TABLE_COUNT, STAT_TABLE_SUM],
-                                         ascending=[False, True]).astype(int),
+            data_frame=stats.astype({col: int for col in stats.select_dtypes('floating').columns}),
             **kwargs
         )
 
-    def contribution_table(self, deltas=[1, 10, 100], contribution=True, **kwargs):
+    def contribution_table(self, deltas=CONTRIBUTION_TABLE_DELTAS, contribution=True, **kwargs):
         """
         The contribution table allows to show the contribution of each experiment-ware: a
         contribution corresponds to
@@ -1195,19 +1665,20 @@ class DecisionAnalysis(BasicAnalysis):
         @param kwargs: kwargs are given to the 'export_data_frame(...)' function
         @return: a contribution table as a dataframe
         """
-        contrib_raw = self._data_frame.groupby(EXPERIMENT_INPUT).apply(
-            lambda x: _contribution_agg(x))
+        contrib_raw = _contribution_raw(self._data_frame)
         contrib = pd.DataFrame()
 
-        contrib['vbew simple'] = contrib_raw.groupby(EXPERIMENT_XP_WARE).cpu_time.count()
+        contrib['vbew simple'] = contrib_raw.groupby(EXPERIMENT_XP_WARE, observed=True).cpu_time.count()
 
         for delta in deltas:
             sub = contrib_raw[(contrib_raw['second_time'] - contrib_raw.cpu_time) >= delta]
-            contrib[f'vbew {delta}s'] = sub.groupby(EXPERIMENT_XP_WARE).cpu_time.count()
+            contrib[f'vbew {delta}s'] = sub.groupby(EXPERIMENT_XP_WARE, sort=False,
+                                                    observed=True).cpu_time.count()
         sort_columns = ['vbew simple']
         sort_order = [False]
         if contribution:
-            contrib['contribution'] = contrib_raw.groupby(EXPERIMENT_XP_WARE).unique.sum()
+            contrib['contribution'] = contrib_raw.groupby(EXPERIMENT_XP_WARE, sort=False,
+                                                          observed=True).unique.sum()
             sort_columns.append('contribution')
             sort_order.append(False)
         return export_data_frame(
@@ -1268,8 +1739,8 @@ class DecisionAnalysis(BasicAnalysis):
 
     def performance_profile(self, vbew_name, **kwargs: dict):
         df_solved = self.data_frame[self.data_frame[SUCCESS_COL]]
-        local_analysis = self.add_variable('performance_ratio',
-                                           lambda row: _compute_performance_ratio(df_solved, row, vbew_name))
+        local_analysis = self.add_variable(
+            'performance_ratio', _compute_performance_ratio(self.data_frame, df_solved, vbew_name))
         return local_analysis.cdf_plot(cdf_col='performance_ratio', **kwargs)
 
     def box_plot(self, box_col=EXPERIMENT_CPU_TIME, box_by=EXPERIMENT_XP_WARE, **kwargs: dict):
@@ -1318,15 +1789,40 @@ class DataFrameBuilder:
         experiment_wares_df = self._make_experiment_wares_df()
         inputs_df = self._make_inputs_df()
         experiments_df = self._make_experiments_df()
-        df = experiments_df \
-            .join(inputs_df.set_index(INPUT_NAME), on=EXPERIMENT_INPUT, lsuffix=SUFFIX_EXPERIMENT,
-                  rsuffix=SUFFIX_INPUT,
-                  how='inner') \
-            .join(experiment_wares_df.set_index(XP_WARE_NAME),
-                  on=EXPERIMENT_XP_WARE, lsuffix=SUFFIX_EXPERIMENT, rsuffix=SUFFIX_XP_WARE,
-                  how='inner'
-                  )
-        return df
+        df = self._attach(experiments_df, inputs_df.set_index(INPUT_NAME), EXPERIMENT_INPUT,
+                          SUFFIX_INPUT)
+        return self._attach(df, experiment_wares_df.set_index(XP_WARE_NAME), EXPERIMENT_XP_WARE,
+                            SUFFIX_XP_WARE)
+
+    @staticmethod
+    def _attach(experiments_df: DataFrame, metadata_df: DataFrame, key: str, rsuffix: str) -> DataFrame:
+        """
+        Attaches to each experiment the metadata of the element it references, as an inner join
+        would do, but by looking up the position of each reference in the (small) metadata index
+        instead of hashing both sides.
+        @param experiments_df: the data frame of experiments.
+        @param metadata_df: the metadata indexed by the name of the referenced elements.
+        @param key: the column of the experiments referencing the elements.
+        @param rsuffix: the suffix of the metadata columns also present in the experiments.
+        @return: the experiments referencing a known element, with their metadata.
+        """
+        if not metadata_df.index.is_unique:
+            return experiments_df.join(metadata_df, on=key, lsuffix=SUFFIX_EXPERIMENT,
+                                       rsuffix=rsuffix, how='inner')
+
+        positions = metadata_df.index.get_indexer(experiments_df[key])
+        known = positions >= 0
+        if not known.all():
+            experiments_df = experiments_df[known]
+            positions = positions[known]
+
+        overlap = experiments_df.columns.intersection(metadata_df.columns)
+        if len(overlap) > 0:
+            experiments_df = experiments_df.rename(columns={c: c + SUFFIX_EXPERIMENT for c in overlap})
+            metadata_df = metadata_df.rename(columns={c: c + rsuffix for c in overlap})
+
+        metadata_df = metadata_df.iloc[positions].set_axis(experiments_df.index)
+        return pd.concat([experiments_df, metadata_df], axis=1)
 
     def _make_experiment_wares_df(self) -> DataFrame:
         """
@@ -1,11 +1,16 @@
 import json
+import math
+import os
+import pickle
+import tempfile
 import unittest
 
 import jsonpickle
 
 from metrics.core.builder.builder import CampaignBuilder
 from metrics.core.constants import *
-from metrics.core.model import Campaign
+from metrics.core.model import Campaign, Experiment, InputSet
+from metrics.scalpel import read_json
 
 
 JSON_CAMPAIGN = {
@@ -105,6 +110,37 @@ class CampaignTestCase(unittest.TestCase):
         json_c = jsonpickle.encode(c, unpicklable=False)
         self.assertEqual(JSON_CAMPAIGN, json.loads(json_c))
 
+    def test_success_export_binary_campaign(self):
+        c = pickle.loads(self.cb.build().export(binary=True))
+        self.assertTrue(isinstance(c, Campaign))
+        self.assertEqual(JSON_CAMPAIGN, json.loads(jsonpickle.encode(c, unpicklable=False)))
+
+    def test_success_read_json_campaign(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'campaign.json')
+            with open(filename, 'w') as file:
+                file.write(self.cb.build().export())
+            c = read_json(filename)
+        self.assertTrue(isinstance(c, Campaign))
+        self.assertTrue(isinstance(c.input_set, InputSet))
+        self.assertTrue(isinstance(c.experiments[0], Experiment))
+        self.assertEqual(JSON_CAMPAIGN, json.loads(jsonpickle.encode(c, unpicklable=False)))
+
+    def test_success_read_json_campaign_with_nan(self):
+        builder = self.cb.add_experiment_builder()
+        builder['id'] = 2
+        builder[EXPERIMENT_INPUT] = 'input'
+        builder['start_time'] = 'now'
+        builder[EXPERIMENT_XP_WARE] = 'ConAbs'
+        builder[EXPERIMENT_CPU_TIME] = float('nan')
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'campaign.json')
+            with open(filename, 'w') as file:
+                file.write(self.cb.build().export())
+            c = read_json(filename)
+        self.assertEqual(1200., c.experiments[0].cpu_time)
+        self.assertTrue(math.isnan(c.experiments[1].cpu_time))
+
     def test_success_access_campaign_attr(self):
         c = self.cb.build()
         self.assertEqual(c.id, 1)
@@ -1,9 +1,14 @@
+import importlib.util
 import re
 import os
+import tempfile
 import unittest
+import warnings
+
+import pandas as pd
 
 from metrics.core.constants import *
-from metrics.wallet import find_best_cpu_time_input, import_analysis_from_file, DecisionAnalysis
+from metrics.wallet import find_best_cpu_time_input, import_analysis_from_file, DecisionAnalysis, vectorizable
 
 
 class NormalAnalysisManipulationTestCase(unittest.TestCase):
@@ -43,6 +48,57 @@ class NormalAnalysisManipulationTestCase(unittest.TestCase):
 
         self.assertEqual(13200, len(self.analysis.data_frame))
 
+    def test_experiment_wares_after_inplace_filter(self):
+        n_xpw = len(self.analysis.experiment_wares)
+        self.analysis.remove_experiment_wares({'cosoco 2.0'}, inplace=True)
+
+        self.assertEqual(n_xpw - 1, len(self.analysis.experiment_wares))
+        self.assertNotIn('cosoco 2.0', self.analysis.experiment_wares)
+
+    def test_vectorizable_input_consistency(self):
+        expected = self.analysis.copy()
+        expected.check_input_consistency(lambda df: df['Checked answer'].nunique() <= 1)
+        self.analysis.check_input_consistency(
+            vectorizable('nunique', 'Checked answer')(lambda df: False))
+
+        self.assertEqual(list(expected.data_frame[INPUT_CONSISTENCY_COL]),
+                         list(self.analysis.data_frame[INPUT_CONSISTENCY_COL]))
+
+    def test_categorize(self):
+        analysis = self.analysis.categorize().remove_experiment_wares({'cosoco 2.0'})
+
+        self.assertEqual('category', analysis.data_frame[EXPERIMENT_XP_WARE].dtype.name)
+        self.assertEqual(len(analysis.experiment_wares),
+                         len(analysis.data_frame[EXPERIMENT_XP_WARE].cat.categories))
+        self.assertEqual(14400, len(analysis.data_frame))
+
+    def test_categorized_filter_without_copy_warning(self):
+        analysis = self.analysis.categorize()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            analysis.remove_experiment_wares({'cosoco 2.0'}, inplace=True)
+
+        self.assertEqual([], [w for w in caught if w.category.__name__ == 'SettingWithCopyWarning'])
+        self.assertNotIn('cosoco 2.0', analysis.data_frame[EXPERIMENT_XP_WARE].cat.categories)
+
+    def test_downcast(self):
+        analysis = self.analysis.downcast()
+
+        self.assertEqual('float32', analysis.data_frame[EXPERIMENT_CPU_TIME].dtype.name)
+        self.assertEqual('float64', self.analysis.data_frame[EXPERIMENT_CPU_TIME].dtype.name)
+        self.assertEqual(self.analysis.data_frame[SUCCESS_COL].sum(),
+                         analysis.data_frame[SUCCESS_COL].sum())
+
+    def test_filters_see_inplace_changes(self):
+        common = self.analysis.keep_common_solved_inputs()
+        common.remove_experiment_wares({'cosoco 2.0'}, inplace=True)
+        self.assertEqual(len(self.analysis.experiment_wares),
+                         len(self.analysis.keep_common_solved_inputs().experiment_wares))
+
+        self.assertEqual(1456, len(self.analysis.keep_common_solved_inputs().data_frame))
+        self.analysis.check_success(lambda x: x['Checked answer'] == 'SAT')
+        self.assertEqual(962, len(self.analysis.keep_common_solved_inputs().data_frame))
+
     def test_filter_method_2(self):
         self.analysis = self.analysis.filter_analysis(lambda x: 'CSP' == x['Category'])
 
@@ -59,6 +115,13 @@ class NormalAnalysisManipulationTestCase(unittest.TestCase):
 
         self.assertEqual(3600, len(self.analysis.data_frame))
 
+    def test_filter_inputs_with_mask(self):
+        expected = self.analysis.filter_inputs(lambda x: x[SUCCESS_COL], how='any')
+        analysis = self.analysis.filter_inputs(self.analysis.data_frame[SUCCESS_COL], how='any')
+
+        self.assertEqual(len(expected.data_frame), len(analysis.data_frame))
+        self.assertEqual(len(expected.data_frame), len(self.analysis.delete_common_failed_inputs().data_frame))
+
     def test_error_table(self):
         self.assertEqual(2131, len(self.analysis.error_table()))
 
@@ -104,6 +167,28 @@ class NormalAnalysisManipulationTestCase(unittest.TestCase):
         self.assertEqual([600], list(self.analysis.data_frame.groupby(EXPERIMENT_XP_WARE).apply(lambda df: len(df)).unique()))
         self.assertEqual(600, len(self.analysis.inputs))
 
+    def test_several_vbs(self):
+        xp_ware_set = {'AbsCon 2019-07-23', 'PicatSAT 2019-09-12'}
+        analysis = self.analysis.add_virtual_experiment_wares([
+            (find_best_cpu_time_input, xp_ware_set, 'VBS1'),
+            (find_best_cpu_time_input, None, 'VBS2')
+        ])
+
+        # VBS2 is made of the experiment-wares of the initial analysis only, not of VBS1.
+        expected = self.analysis \
+            .add_virtual_experiment_ware(find_best_cpu_time_input, xp_ware_set, 'VBS1') \
+            .add_virtual_experiment_ware(find_best_cpu_time_input, self.analysis.experiment_wares,
+                                         'VBS2')
+
+        self.assertEqual(len(expected.data_frame), len(analysis.data_frame))
+        for name in ['VBS1', 'VBS2']:
+            df = analysis.data_frame
+            expected_df = expected.data_frame
+            pd.testing.assert_frame_equal(
+                expected_df[expected_df[EXPERIMENT_XP_WARE] == name].reset_index(drop=True),
+                df[df[EXPERIMENT_XP_WARE] == name].reset_index(drop=True)
+            )
+
     def test_export(self):
         file = f'{self._example_dir}/xcsp19/full_analysis/analysis.csv'
         self.analysis.export(file)
@@ -112,6 +197,17 @@ class NormalAnalysisManipulationTestCase(unittest.TestCase):
         self.assertEqual(4509, self.analysis.data_frame[SUCCESS_COL].sum())
         self.assertEqual(4509, analysis.data_frame[SUCCESS_COL].sum())
 
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_export_columnar_formats(self):
+        for ext in ['feather', 'parquet']:
+            with self.subTest(ext=ext), tempfile.TemporaryDirectory() as directory:
+                file = os.path.join(directory, f'analysis.{ext}')
+                self.analysis.export(file)
+                analysis = DecisionAnalysis.import_from_file(file)
+
+                pd.testing.assert_frame_equal(self.analysis.data_frame.reset_index(drop=True),
+                                              analysis.data_frame.reset_index(drop=True))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -38,6 +38,19 @@ class NormalAnalysisTablesTestCase(unittest.TestCase):
         self.assertEqual(255, df.loc['cosoco 2.0', 'count'])
         self.assertEqual(2353, df.loc['AbsCon 2019-07-23', 'common sum'])
 
+    def test_stat_table_after_downcast(self):
+        df = self.analysis.stat_table()
+        downcast_analysis = self.analysis.downcast()
+        downcast_df = downcast_analysis.stat_table()
+
+        self.assertEqual(self.analysis.data_frame['timeout'].dtype,
+                         downcast_analysis.data_frame['timeout'].dtype)
+        self.assertEqual(291, downcast_df.loc['Concrete 3.12.2', 'count'])
+        for col in ['PAR1', 'PAR2', 'PAR10']:
+            self.assertGreater(downcast_df.loc['Concrete 3.12.2', col], 0)
+            self.assertAlmostEqual(df.loc['Concrete 3.12.2', col],
+                                   downcast_df.loc['Concrete 3.12.2', col], delta=10)
+
     def test_pivot_table(self):
         self.analysis = self.analysis.remove_experiment_wares({
             'Concrete 3.12.2',
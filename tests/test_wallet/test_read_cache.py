@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from metrics.wallet import DecisionAnalysis, clear_cache
+from metrics.wallet.analysis import _cached_read_campaign
+
+
+class ReadCacheTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        dirname = os.path.dirname(__file__)
+        self._example_dir = os.path.join(dirname, '..', 'data')
+        self._tmp_dir = tempfile.mkdtemp()
+        self._log_file = os.path.join(self._tmp_dir, 'XCSP19.txt')
+        shutil.copyfile(f'{self._example_dir}/xcsp19/full_analysis/input/XCSP19.txt',
+                        self._log_file)
+
+        # The configuration reads the copied log file, so that it can be modified.
+        with open(f'{self._example_dir}/xcsp19/full_analysis/config/metrics_scalpel_full_paths.yml') as file:
+            config = file.read().replace('tests/data/xcsp19/full_analysis/input/XCSP19.txt',
+                                         self._log_file)
+        self._input_file = os.path.join(self._tmp_dir, 'metrics_scalpel.yml')
+        with open(self._input_file, 'w') as file:
+            file.write(config)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._tmp_dir)
+        clear_cache()
+
+    def test_modified_log_file_is_read_again(self):
+        self.assertEqual(15600, len(DecisionAnalysis(input_file=self._input_file).data_frame))
+
+        with open(self._log_file) as file:
+            lines = file.readlines()
+        with open(self._log_file, 'w') as file:
+            file.writelines(line for line in lines if '| cosoco ' not in line)
+        # Makes sure the modification time changes, whatever the resolution of the file system.
+        stat = os.stat(self._log_file)
+        os.utime(self._log_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        analysis = DecisionAnalysis(input_file=self._input_file)
+        self.assertNotIn('cosoco 2.0', analysis.experiment_wares)
+        self.assertLess(len(analysis.data_frame), 15600)
+
+    def test_campaign_is_cached_by_absolute_path(self):
+        campaign, _ = _cached_read_campaign(self._input_file, 'WARNING')
+        relative_input_file = os.path.relpath(self._input_file)
+
+        self.assertIs(campaign, _cached_read_campaign(relative_input_file, 'WARNING')[0])
+
+    def test_clear_cache(self):
+        campaign, _ = _cached_read_campaign(self._input_file, 'WARNING')
+        self.assertIs(campaign, _cached_read_campaign(self._input_file, 'WARNING')[0])
+
+        clear_cache()
+
+        self.assertIsNot(campaign, _cached_read_campaign(self._input_file, 'WARNING')[0])
+
+
+if __name__ == '__main__':
+    unittest.main()